@@ -1,5 +1,7 @@
 
 use pyo3::prelude::*;
+use pyo3::buffer::PyBuffer;
+use pyo3::exceptions::PyValueError;
 use std::fs::File;
 use std::path::Path;
 use memmap2::MmapOptions;
@@ -17,7 +19,9 @@ fn get_re_internal_field() -> &'static Regex {
 }
 
 fn get_re_nonuniform() -> &'static Regex {
-    RE_NONUNIFORM.get_or_init(|| Regex::new(r"nonuniform").unwrap())
+    // Anchored to the start of the window (right after "internalField"), so a uniform
+    // internalField never picks up a boundary patch's "value nonuniform ..." list.
+    RE_NONUNIFORM.get_or_init(|| Regex::new(r"^\s*nonuniform").unwrap())
 }
 
 fn get_re_uniform() -> &'static Regex {
@@ -64,30 +68,8 @@ fn parse_scalar_field(py: Python, path: String) -> PyResult<Option<f64>> {
                 }
 
                 if let Some(start) = paren_start {
-                    // Find matching ')'
-                    // Usually before boundaryField
-                    // For speed, let's just search for the last ')' before EOF or before "boundaryField"
-                    // But robustly, we should scan forward.
-                    // Assuming well-formed file.
-
-                    // Let's find "boundaryField"
-                    let boundary_re = Regex::new(r"boundaryField").unwrap();
-                    let end_limit = if let Some(b_mat) = boundary_re.find_at(&mmap, start) {
-                        b_mat.start()
-                    } else {
-                        mmap.len()
-                    };
-
-                    // Find last ')' in range
-                    let mut paren_end = None;
-                    for i in (start..end_limit).rev() {
-                        if mmap[i] == b')' {
-                            paren_end = Some(i);
-                            break;
-                        }
-                    }
-
-                    if let Some(end) = paren_end {
+                    // Find matching ')' backward from boundaryField (see list_end)
+                    if let Some(end) = list_end(&mmap, start) {
                         let list_content = &mmap[start+1..end];
                         // Parse numbers (simulating np.mean)
                         // We can iterate and parse.
@@ -168,23 +150,8 @@ fn parse_vector_field(py: Python, path: String) -> PyResult<(f64, f64, f64)> {
                 }
 
                 if let Some(start) = paren_start {
-                     // Find boundaryField
-                    let boundary_re = Regex::new(r"boundaryField").unwrap();
-                    let end_limit = if let Some(b_mat) = boundary_re.find_at(&mmap, start) {
-                        b_mat.start()
-                    } else {
-                        mmap.len()
-                    };
-
-                    let mut paren_end = None;
-                    for i in (start..end_limit).rev() {
-                        if mmap[i] == b')' {
-                            paren_end = Some(i);
-                            break;
-                        }
-                    }
-
-                    if let Some(end) = paren_end {
+                    // Find matching ')' backward from boundaryField (see list_end)
+                    if let Some(end) = list_end(&mmap, start) {
                         let list_content = &mmap[start+1..end];
 
                         let mut sum_x = 0.0;
@@ -253,9 +220,257 @@ fn parse_vector_field(py: Python, path: String) -> PyResult<(f64, f64, f64)> {
     })
 }
 
+// --- Residual log scanning ---
+// Mirrors _scan_residuals_chunk in backend/plots/realtime_plots.py token for token.
+
+const SOLVING_FOR_TOKEN: &[u8] = b"Solving for ";
+const INITIAL_RESIDUAL_TOKEN: &[u8] = b"Initial residual =";
+
+type ResidualChunk = (Vec<f64>, Vec<(String, Vec<f64>)>, usize);
+
+/// Python's bytes.isspace() set (includes \x0b, unlike u8::is_ascii_whitespace).
+fn is_py_space(b: u8) -> bool {
+    matches!(b, b' ' | b'\t' | b'\n' | b'\r' | b'\x0b' | b'\x0c')
+}
+
+fn strip_py(mut s: &[u8]) -> &[u8] {
+    while let [first, rest @ ..] = s {
+        if !is_py_space(*first) {
+            break;
+        }
+        s = rest;
+    }
+    while let [rest @ .., last] = s {
+        if !is_py_space(*last) {
+            break;
+        }
+        s = rest;
+    }
+    s
+}
+
+/// Equivalent of Python's float(bytes) for the values found in solver logs.
+fn parse_py_float(s: &[u8]) -> Option<f64> {
+    std::str::from_utf8(strip_py(s)).ok()?.parse::<f64>().ok()
+}
+
+/// mm.find(needle, from, to): absolute index of needle fully inside hay[from..to].
+fn find_in(hay: &[u8], needle: &[u8], from: usize, to: usize) -> Option<usize> {
+    let to = to.min(hay.len());
+    if from >= to || to - from < needle.len() {
+        return None;
+    }
+    let first = needle[0];
+    let last_start = to - needle.len();
+    let mut i = from;
+    while i <= last_start {
+        match hay[i..=last_start].iter().position(|&b| b == first) {
+            Some(off) => {
+                let at = i + off;
+                if &hay[at..at + needle.len()] == needle {
+                    return Some(at);
+                }
+                i = at + 1;
+            }
+            None => return None,
+        }
+    }
+    None
+}
+
+/// Last occurrence of `needle` in `hay[from..]`, scanning from the end.
+fn rfind_in(hay: &[u8], needle: &[u8], from: usize) -> Option<usize> {
+    if from > hay.len() || hay.len() - from < needle.len() {
+        return None;
+    }
+    hay[from..]
+        .windows(needle.len())
+        .rposition(|w| w == needle)
+        .map(|off| from + off)
+}
+
+/// Offset of the ')' closing the internalField list opened at `start` (mirrors the
+/// Python _nonuniform_list_span). Both searches run backward from the end of the file,
+/// so only the boundaryField section is touched, never the list itself; a forward
+/// find of "boundaryField" would page in the whole data block before parsing it.
+fn list_end(hay: &[u8], start: usize) -> Option<usize> {
+    let limit = rfind_in(hay, b"boundaryField", start).unwrap_or(hay.len());
+    hay[start..limit]
+        .iter()
+        .rposition(|&b| b == b')')
+        .map(|off| start + off)
+}
+
+fn find_byte(hay: &[u8], byte: u8, from: usize, to: usize) -> Option<usize> {
+    let to = to.min(hay.len());
+    if from >= to {
+        return None;
+    }
+    hay[from..to].iter().position(|&b| b == byte).map(|off| from + off)
+}
+
+/// Python regex `Time\s*=\s*([-+]?\d*\.?\d+(?:[eE][-+]?\d+)?)` searched in line.
+fn match_time_fallback(line: &[u8]) -> Option<f64> {
+    let digits = |mut j: usize| {
+        while j < line.len() && line[j].is_ascii_digit() {
+            j += 1;
+        }
+        j
+    };
+    let mut from = 0;
+    while let Some(at) = find_in(line, b"Time", from, line.len()) {
+        from = at + 1;
+        let mut j = at + 4;
+        while j < line.len() && is_py_space(line[j]) {
+            j += 1;
+        }
+        if j >= line.len() || line[j] != b'=' {
+            continue;
+        }
+        j += 1;
+        while j < line.len() && is_py_space(line[j]) {
+            j += 1;
+        }
+        let num_start = j;
+        if j < line.len() && (line[j] == b'-' || line[j] == b'+') {
+            j += 1;
+        }
+        // \d*\.?\d+ : prefer "digits.digits", else plain digits
+        let int_end = digits(j);
+        let mut end = if int_end < line.len() && line[int_end] == b'.' {
+            let frac_end = digits(int_end + 1);
+            if frac_end > int_end + 1 {
+                frac_end
+            } else {
+                int_end
+            }
+        } else {
+            int_end
+        };
+        if end == j {
+            continue;
+        }
+        // (?:[eE][-+]?\d+)?
+        if end < line.len() && (line[end] == b'e' || line[end] == b'E') {
+            let mut k = end + 1;
+            if k < line.len() && (line[k] == b'-' || line[k] == b'+') {
+                k += 1;
+            }
+            let exp_end = digits(k);
+            if exp_end > k {
+                end = exp_end;
+            }
+        }
+        return parse_py_float(&line[num_start..end]);
+    }
+    None
+}
+
+/// Scan buf from start for "Time = <t>" and "Solving for <f>, Initial residual = <r>"
+/// lines. Only complete lines are consumed. Returns (times, per-field residuals in
+/// first-seen order, offset to resume from).
+fn scan_residuals(buf: &[u8], start: usize) -> Result<ResidualChunk, std::str::Utf8Error> {
+    let mut times = Vec::new();
+    let mut fields: Vec<(String, Vec<f64>)> = Vec::new();
+    let mut field_index: std::collections::HashMap<&[u8], usize> =
+        std::collections::HashMap::new();
+
+    let mut pos = start;
+    // End of the last complete line: every token found before it lies on a complete line
+    let scan_end = if pos < buf.len() {
+        buf[pos..]
+            .iter()
+            .rposition(|&b| b == b'\n')
+            .map_or(pos, |off| pos + off + 1)
+    } else {
+        pos
+    };
+
+    let mut next_time = if pos < scan_end && buf[pos..].starts_with(b"Time") {
+        Some(pos)
+    } else {
+        find_in(buf, b"\nTime", pos, scan_end)
+    };
+    let mut next_solving = find_in(buf, SOLVING_FOR_TOKEN, pos, scan_end);
+
+    loop {
+        let time_first = match (next_time, next_solving) {
+            (None, None) => break,
+            (Some(t), Some(s)) => t < s,
+            (Some(_), None) => true,
+            (None, Some(_)) => false,
+        };
+
+        if time_first {
+            let t = next_time.unwrap();
+            let content_start = if buf[t] == b'\n' { t + 1 } else { t };
+            let eol = find_byte(buf, b'\n', content_start, scan_end).unwrap_or(scan_end);
+
+            if let Some(eq) = find_byte(buf, b'=', content_start, eol) {
+                match parse_py_float(&buf[eq + 1..eol]) {
+                    Some(v) => times.push(v),
+                    None => {
+                        if let Some(v) = match_time_fallback(&buf[content_start..eol]) {
+                            times.push(v);
+                        }
+                    }
+                }
+            }
+
+            pos = eol + 1;
+            next_time = find_in(buf, b"\nTime", pos, scan_end);
+        } else {
+            let field_start = next_solving.unwrap() + SOLVING_FOR_TOKEN.len();
+            let eol = find_byte(buf, b'\n', field_start, scan_end).unwrap_or(scan_end);
+
+            if let Some(res_idx) = find_in(buf, INITIAL_RESIDUAL_TOKEN, field_start, eol) {
+                let raw_field_end = find_byte(buf, b',', field_start, res_idx).unwrap_or(res_idx);
+                let field_bytes = strip_py(&buf[field_start..raw_field_end]);
+                let field = std::str::from_utf8(field_bytes)?;
+
+                let val_start = res_idx + INITIAL_RESIDUAL_TOKEN.len();
+                let val_end = find_byte(buf, b',', val_start, eol).unwrap_or(eol);
+
+                if let Some(val) = parse_py_float(&buf[val_start..val_end]) {
+                    let idx = *field_index.entry(field_bytes).or_insert_with(|| {
+                        fields.push((field.to_owned(), Vec::new()));
+                        fields.len() - 1
+                    });
+                    fields[idx].1.push(val);
+                }
+            }
+
+            pos = eol + 1;
+            next_solving = find_in(buf, SOLVING_FOR_TOKEN, pos, scan_end);
+        }
+    }
+
+    Ok((times, fields, scan_end))
+}
+
+#[pyfunction]
+fn parse_residuals_chunk(
+    py: Python,
+    data: PyBuffer<u8>,
+    start: usize,
+) -> PyResult<ResidualChunk> {
+    if !data.is_c_contiguous() {
+        return Err(PyValueError::new_err("log buffer must be contiguous"));
+    }
+    // The buffer (e.g. the caller's mmap) stays exported until `data` is dropped,
+    // so the slice is valid for the whole scan; the GIL is released meanwhile.
+    let ptr = data.buf_ptr() as usize;
+    let len = data.len_bytes();
+    py.allow_threads(move || {
+        let buf = unsafe { std::slice::from_raw_parts(ptr as *const u8, len) };
+        scan_residuals(buf, start).map_err(|e| PyValueError::new_err(e.to_string()))
+    })
+}
+
 #[pymodule]
 fn accelerator(m: &Bound<'_, PyModule>) -> PyResult<()> {
     m.add_function(wrap_pyfunction!(parse_scalar_field, m)?)?;
     m.add_function(wrap_pyfunction!(parse_vector_field, m)?)?;
+    m.add_function(wrap_pyfunction!(parse_residuals_chunk, m)?)?;
     Ok(())
 }
@@ -445,7 +445,7 @@ class TestPlottingEndpoints:
 
     def test_api_plot_data_mocked(self, client):
         mock_parser = MagicMock()
-        mock_parser.get_all_time_series_data.return_value = {'time': [0.1], 'data': {'U': [1, 2, 3]}}
+        mock_parser.get_all_time_series_json.return_value = b'{"time":[0.1],"data":{"U":[1,2,3]}}'
         with patch('os.stat') as mock_stat, \
              patch('app.OpenFOAMFieldParser', return_value=mock_parser):
             mock_stat.return_value.st_mtime = 12345.0
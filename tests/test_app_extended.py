@@ -99,7 +99,7 @@ class TestAppExtended:
             mock_stat.return_value = mock_stat_result
 
             mock_parser.return_value.get_time_directories.return_value = ["0", "1"]
-            mock_parser.return_value.get_all_time_series_data.return_value = {}
+            mock_parser.return_value.get_all_time_series_json.return_value = b"{}"
 
             etag = '"1000-1000"' # Old etag
             response = client.get('/api/plot_data?tutorial=case', headers={"If-None-Match": etag})
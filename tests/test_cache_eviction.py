@@ -53,3 +53,168 @@ def test_cache_bounded_growth(tmp_path):
     assert len(_TIME_DIRS_CACHE) == MAX_CACHE_CASES
     assert str(cases[0]) not in _TIME_DIRS_CACHE
     assert str(cases[6]) in _TIME_DIRS_CACHE
+
+
+def test_lru_cache_evicts_least_recently_used():
+    from backend.plots.realtime_plots import LRUCache
+
+    cache = LRUCache(maxsize=2)
+    cache["a"] = 1
+    cache["b"] = 2
+    assert cache.get("a") == 1  # "a" becomes most recently used
+    cache["c"] = 3
+
+    assert "b" not in cache
+    assert list(cache) == ["a", "c"]
+    assert cache.get("missing", "default") == "default"
+
+
+def test_lru_cache_get_many_marks_hits_recently_used():
+    from backend.plots.realtime_plots import LRUCache
+
+    cache = LRUCache(maxsize=3)
+    cache["a"] = 1
+    cache["b"] = 2
+    cache["c"] = 3
+
+    assert cache.get_many(["a", "missing", "b"]) == [1, None, 2]
+    cache["d"] = 4
+    assert list(cache) == ["a", "b", "d"]
+
+
+def test_lru_cache_pop_prefix_under_concurrent_writes():
+    import threading
+
+    from backend.plots.realtime_plots import LRUCache
+
+    cache = LRUCache(maxsize=1000)
+    stop = threading.Event()
+    errors = []
+
+    def writer():
+        i = 0
+        while not stop.is_set():
+            try:
+                cache[f"/case/{i % 500}"] = i
+                cache.pop(f"/case/{(i + 7) % 500}", None)
+            except Exception as e:  # pragma: no cover - only on regression
+                errors.append(e)
+            i += 1
+
+    threads = [threading.Thread(target=writer) for _ in range(4)]
+    for t in threads:
+        t.start()
+    try:
+        for _ in range(200):
+            cache.pop_prefix("/case/")
+    finally:
+        stop.set()
+        for t in threads:
+            t.join()
+
+    assert errors == []
+    cache["/other/x"] = 1
+    cache.pop_prefix("/case/")
+    assert list(cache) == ["/other/x"]
+
+
+@pytest.mark.parametrize("n_evict", [1, 8])
+def test_lru_cache_pop_many_keeps_survivor_order(n_evict):
+    from backend.plots.realtime_plots import LRUCache
+
+    cache = LRUCache(maxsize=20)
+    for i in range(10):
+        cache[f"k{i}"] = i
+    cache.get("k0")  # "k0" becomes most recently used
+
+    # Small batches pop in place; large ones rebuild the survivors
+    evict = [f"k{i}" for i in range(1, 1 + n_evict)] + ["missing"]
+    cache.pop_many(evict)
+
+    survivors = [f"k{i}" for i in range(1 + n_evict, 10)] + ["k0"]
+    assert list(cache) == survivors
+    assert all(cache[k] == int(k[1:]) for k in survivors)
+
+
+def test_negative_and_dir_scan_caches_are_bounded(tmp_path):
+    from unittest.mock import patch
+    from backend.plots import realtime_plots
+
+    clear_cache()
+    negative = realtime_plots._NEGATIVE_CACHE
+    scans = realtime_plots._DIR_SCAN_CACHE
+    with patch.object(negative, "maxsize", 3), patch.object(scans, "maxsize", 2):
+        for i in range(10):
+            realtime_plots._remember_failure(str(tmp_path / f"missing{i}"))
+            time_dir = tmp_path / f"{i + 1}"
+            time_dir.mkdir()
+            (time_dir / "p").write_text("class volScalarField;\ninternalField uniform 1;")
+            OpenFOAMFieldParser(tmp_path)._scan_time_dir(str(time_dir))
+
+        assert list(negative) == [str(tmp_path / f"missing{i}") for i in (7, 8, 9)]
+        assert list(scans) == [str(tmp_path / "9"), str(tmp_path / "10")]
+
+    clear_cache(str(tmp_path))
+    assert len(negative) == 0 and len(scans) == 0
+
+
+def test_case_field_types_cache_is_bounded(tmp_path):
+    from unittest.mock import patch
+    from backend.plots import realtime_plots
+
+    clear_cache()
+    types = realtime_plots._CASE_FIELD_TYPES
+    with patch.object(types, "maxsize", 2):
+        for i in range(4):
+            case = tmp_path / f"case{i}"
+            (case / "1").mkdir(parents=True)
+            (case / "1" / "myField").write_text("class volScalarField;\ninternalField uniform 1;")
+            OpenFOAMFieldParser(case)._get_field_type(case / "1" / "myField")
+
+        assert list(types) == [str(tmp_path / "case2"), str(tmp_path / "case3")]
+        assert types[str(tmp_path / "case3")] == {"myField": "scalar"}
+
+        # setdefault returns the existing per-case dict and refreshes its recency
+        assert types.setdefault(str(tmp_path / "case2"), {}) == {"myField": "scalar"}
+        assert list(types)[-1] == str(tmp_path / "case2")
+
+    clear_cache()
+
+
+def test_time_series_locks_are_pruned_with_evicted_cases(tmp_path):
+    from backend.plots import realtime_plots
+
+    clear_cache()
+    for i in range(MAX_CACHE_CASES + 2):
+        case_dir = tmp_path / f"case_{i}"
+        for t in ("0.1", "0.2"):
+            (case_dir / t).mkdir(parents=True)
+            (case_dir / t / "p").write_text("class volScalarField;\ninternalField uniform 1;")
+        OpenFOAMFieldParser(case_dir).get_all_time_series_data()
+
+    assert set(realtime_plots._TIME_SERIES_LOCKS) == set(_TIME_SERIES_CACHE)
+    clear_cache()
+
+
+def test_time_series_lock_waiter_retries_after_prune():
+    import threading
+    from backend.plots import realtime_plots
+
+    case = "/tmp/pruned-case"
+    acquired = []
+    with realtime_plots._time_series_lock(case):
+        old_lock = realtime_plots._TIME_SERIES_LOCKS[case]
+
+        def waiter():
+            with realtime_plots._time_series_lock(case):
+                acquired.append(realtime_plots._TIME_SERIES_LOCKS[case])
+
+        thread = threading.Thread(target=waiter)
+        thread.start()
+        # Simulate the case being pruned while the waiter blocks on the old lock
+        realtime_plots._TIME_SERIES_LOCKS.pop(case)
+    thread.join(timeout=5)
+
+    assert acquired and acquired[0] is not old_lock
+    assert not old_lock.locked()
+    realtime_plots._TIME_SERIES_LOCKS.pop(case, None)
@@ -0,0 +1,57 @@
+from unittest.mock import patch
+
+from backend.plots import realtime_plots
+from backend.plots.realtime_plots import OpenFOAMFieldParser, clear_cache
+
+
+def test_missing_field_is_negatively_cached(tmp_path):
+    clear_cache()
+    field = tmp_path / "p"
+    path_str = str(field)
+    parser = OpenFOAMFieldParser(tmp_path)
+
+    assert parser.parse_scalar_field(path_str) is None
+    assert path_str in realtime_plots._NEGATIVE_CACHE
+
+    # The file appears, but the failure is honoured until the TTL expires
+    field.write_text("class volScalarField;\ninternalField uniform 7;")
+    with patch("backend.plots.realtime_plots.os.stat") as mock_stat:
+        assert parser.parse_scalar_field(path_str) is None
+        assert mock_stat.call_count == 0
+
+    # A known mtime proves the file exists and bypasses the negative cache
+    assert parser.parse_scalar_field(path_str, known_mtime=field.stat().st_mtime) == 7.0
+
+
+def test_negative_cache_expires(tmp_path):
+    clear_cache()
+    path_str = str(tmp_path / "U")
+    parser = OpenFOAMFieldParser(tmp_path)
+
+    assert parser.parse_vector_field(path_str) == (0.0, 0.0, 0.0)
+    (tmp_path / "U").write_text("class volVectorField;\ninternalField uniform (1 2 3);")
+
+    realtime_plots._NEGATIVE_CACHE[path_str] = 0.0  # force expiry
+    assert parser.parse_vector_field(path_str) == (1.0, 2.0, 3.0)
+    assert path_str not in realtime_plots._NEGATIVE_CACHE
+
+
+def test_failed_latest_step_is_reparsed_once_historical(tmp_path):
+    clear_cache()
+    for t, p in (("1", 1.0), ("2", 2.5)):
+        (tmp_path / t).mkdir()
+        (tmp_path / t / "p").write_text(f"class volScalarField;\ninternalField uniform {p};")
+    parser = OpenFOAMFieldParser(tmp_path)
+    parser.get_all_time_series_data(max_points=100)
+
+    # A one-off failed read of the latest step (e.g. mid-write) leaves no cached value ...
+    latest_p = str(tmp_path / "2" / "p")
+    realtime_plots._FILE_CACHE.pop(latest_p, None)
+    realtime_plots._remember_failure(latest_p)
+
+    # ... must not stick once the step becomes immutable history
+    (tmp_path / "3").mkdir()
+    (tmp_path / "3" / "p").write_text("class volScalarField;\ninternalField uniform 3;")
+    data = parser.get_all_time_series_data(max_points=100)
+    assert data["p"].tolist() == [1.0, 2.5, 3.0]
+    clear_cache()
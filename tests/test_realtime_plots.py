@@ -112,8 +112,24 @@ def test_get_all_time_series_data(tmp_path):
     parser = OpenFOAMFieldParser(tmp_path)
     data = parser.get_all_time_series_data()
 
-    assert data["time"] == [0.1, 0.2, 0.3]
-    assert data["p"] == [1, 2, 3]
+    assert data["time"].tolist() == [0.1, 0.2, 0.3]
+    assert data["p"].tolist() == [1, 2, 3]
+
+
+def test_get_all_time_series_data_returns_private_arrays(tmp_path):
+    for idx, t in enumerate(["0.1", "0.2", "0.3"]):
+        f = tmp_path / t / "p"
+        f.parent.mkdir(parents=True, exist_ok=True)
+        f.write_text(f"class volScalarField;\ninternalField uniform {idx + 1};")
+
+    parser = OpenFOAMFieldParser(tmp_path)
+    data = parser.get_all_time_series_data()
+    assert isinstance(data["p"], np.ndarray)
+    assert data["p"].dtype == np.float64
+
+    # Results never alias the cached history
+    data["p"][:] = -1.0
+    assert parser.get_all_time_series_data()["p"].tolist() == [1, 2, 3]
 
 
 def test_calculate_pressure_coefficient():
@@ -128,6 +144,22 @@ def test_calculate_pressure_coefficient():
     assert pytest.approx(cp) == expected
 
 
+def test_calculate_pressure_coefficients_matches_scalar():
+    parser = OpenFOAMFieldParser("dummy")
+    p_values = [101325.0, 101425.0, 100000.0]
+    cp = parser.calculate_pressure_coefficients(p_values)
+    assert cp.tolist() == pytest.approx(
+        [parser.calculate_pressure_coefficient(p) for p in p_values]
+    )
+
+    assert np.isnan(parser.calculate_pressure_coefficients([None, 1.0])[0])
+    assert parser.calculate_pressure_coefficients(p_values, u_inf=0).tolist() == [0.0] * 3
+
+    cp_zero = parser.calculate_pressure_coefficients([None, 101325.0], u_inf=0)
+    assert np.isnan(cp_zero[0]) and cp_zero[1] == 0.0
+    assert parser.calculate_pressure_coefficient(None, u_inf=0) is None
+
+
 def test_get_residuals_from_log(tmp_path):
     log_content = """
 Time = 0.1
@@ -183,7 +215,482 @@ def test_get_residuals_from_log_incremental(tmp_path):
     with open(log_file, "a") as f:
         f.write(chunk2)
 
-    # Second call
-    res2 = parser.get_residuals_from_log("log.foamRun")
+    # Second call: the cached arrays are extended, no fresh structure is built
+    with patch(
+        "backend.plots.realtime_plots._new_residuals", side_effect=AssertionError
+    ):
+        res2 = parser.get_residuals_from_log("log.foamRun")
+    assert res2 is res1
     assert list(res2["time"]) == [1.0, 2.0]
     assert list(res2["Ux"]) == [0.1, 0.05]
+
+
+def test_get_all_time_series_data_u_mag(tmp_path):
+    # Stable steps get U_mag computed in bulk, the latest step individually
+    vectors = {"0.1": (3, 4, 0), "0.2": (0, 0, 2), "0.3": (1, 2, 2)}
+    for t, (x, y, z) in vectors.items():
+        (tmp_path / t).mkdir()
+        (tmp_path / t / "U").write_text(
+            f"class volVectorField;\ninternalField uniform ({x} {y} {z});"
+        )
+
+    parser = OpenFOAMFieldParser(tmp_path)
+    data = parser.get_all_time_series_data()
+
+    assert data["Ux"].tolist() == [3, 0, 1]
+    assert data["U_mag"].tolist() == pytest.approx([5.0, 2.0, 3.0])
+
+
+def test_parse_scalar_field_cache_lookup_order(tmp_path):
+    field = tmp_path / "p"
+    field.write_text("class volScalarField;\ninternalField uniform 1;")
+    path_str = str(field)
+
+    parser = OpenFOAMFieldParser(tmp_path)
+    assert parser.parse_scalar_field(path_str, known_mtime=1.0) == 1.0
+
+    # A hit with a matching known mtime must not touch the filesystem
+    with patch("backend.plots.realtime_plots.os.stat") as mock_stat:
+        assert parser.parse_scalar_field(path_str, known_mtime=1.0) == 1.0
+        assert mock_stat.call_count == 0
+
+    # A different known mtime invalidates the entry even with check_mtime=False
+    field.write_text("class volScalarField;\ninternalField uniform 2;")
+    assert parser.parse_scalar_field(path_str, check_mtime=False, known_mtime=2.0) == 2.0
+
+
+def test_get_time_directories_skips_non_numeric(tmp_path):
+    for name in ["0", "0.005", "1e-05", "constant", "system", "0.orig", "processor0"]:
+        (tmp_path / name).mkdir()
+    (tmp_path / "2").write_text("not a directory")
+
+    parser = OpenFOAMFieldParser(tmp_path)
+    assert parser.get_time_directories() == ["0", "1e-05", "0.005"]
+
+
+def test_get_time_directories_parsed_values_align(tmp_path):
+    for name in ["10", "0", "1.0", "1e-05"]:
+        (tmp_path / name).mkdir()
+
+    parser = OpenFOAMFieldParser(tmp_path)
+    names, values = parser.get_time_directories_parsed()
+    assert names == ["0", "1e-05", "1.0", "10"]
+    assert list(values) == [float(n) for n in names]
+    # get_time_directories shares the cached name list
+    assert parser.get_time_directories() is names
+
+
+def test_vector_cache_stores_magnitude(tmp_path):
+    from backend.plots import realtime_plots
+
+    u_file = tmp_path / "U"
+    u_file.write_text("class volVectorField;\ninternalField uniform (3 4 0);")
+    path_str = str(u_file)
+    realtime_plots._FILE_CACHE.pop(path_str, None)
+
+    parser = OpenFOAMFieldParser(tmp_path)
+    assert parser.parse_vector_field(path_str) == (3.0, 4.0, 0.0)
+
+    # |U| is cached next to the components
+    mtime, cached = realtime_plots._FILE_CACHE[path_str]
+    assert cached == (3.0, 4.0, 0.0, pytest.approx(5.0))
+
+    # Legacy 3-tuple entries are still accepted
+    realtime_plots._FILE_CACHE[path_str] = (mtime, (6.0, 8.0, 0.0))
+    assert parser._parse_vector_field_with_mag(path_str, check_mtime=False) == (
+        6.0,
+        8.0,
+        0.0,
+        pytest.approx(10.0),
+    )
+    assert parser.parse_vector_field(path_str, check_mtime=False) == (6.0, 8.0, 0.0)
+    realtime_plots._FILE_CACHE.pop(path_str, None)
+
+
+def test_parse_scalar_field_text_fallback_mean(tmp_path):
+    # "nonuniform" beyond the mmap look-ahead window forces the text fallback path
+    p_file = tmp_path / "p"
+    p_file.write_text(
+        "internalField" + " " * 300 + "nonuniform List<scalar> 3\n(\n1\n2.5e0\n5.5\n)\n;\n"
+    )
+
+    parser = OpenFOAMFieldParser(tmp_path)
+    with patch("backend.plots.realtime_plots.RUST_ACCELERATOR", False):
+        val = parser.parse_scalar_field(str(p_file), check_mtime=False, store_cache=False)
+
+    assert val == pytest.approx(3.0)
+
+
+def test_parse_scalar_field_commented_list_ignores_comment_numbers(tmp_path):
+    p_file = tmp_path / "p"
+    p_file.write_text(
+        "internalField nonuniform List<scalar> 4\n(\n// block 1 of 99\n1\n2\n"
+        "/* 1000 */ 3\n6 // 42\n)\n;\nboundaryField\n{\n}\n"
+    )
+
+    parser = OpenFOAMFieldParser(tmp_path)
+    with patch("backend.plots.realtime_plots.RUST_ACCELERATOR", False):
+        val = parser.parse_scalar_field(str(p_file), check_mtime=False, store_cache=False)
+
+    assert val == pytest.approx(3.0)
+
+
+@pytest.mark.parametrize(
+    "list_body, expected",
+    [
+        ("// no cells on this processor\n", None),
+        ("1\n-\n3\n", 2.0),
+    ],
+)
+def test_parse_scalar_field_empty_or_stray_token_list(tmp_path, list_body, expected):
+    p_file = tmp_path / "p"
+    p_file.write_text(
+        f"internalField nonuniform List<scalar> 0\n(\n{list_body})\n;\n"
+        "boundaryField\n{\n}\n"
+    )
+
+    parser = OpenFOAMFieldParser(tmp_path)
+    with patch("backend.plots.realtime_plots.RUST_ACCELERATOR", False):
+        val = parser.parse_scalar_field(str(p_file), check_mtime=False, store_cache=False)
+
+    assert val == (None if expected is None else pytest.approx(expected))
+
+
+def test_parse_vector_field_commented_list_ignores_comment_numbers(tmp_path):
+    u_file = tmp_path / "U"
+    u_file.write_text(
+        "internalField nonuniform List<vector> 2\n(\n// cells (7 7 7)\n(1 2 3)\n"
+        "/* (100 100 100) */ (3 4 5)\n)\n;\nboundaryField\n{\n}\n"
+    )
+
+    parser = OpenFOAMFieldParser(tmp_path)
+    with patch("backend.plots.realtime_plots.RUST_ACCELERATOR", False):
+        val = parser.parse_vector_field(str(u_file), check_mtime=False, store_cache=False)
+
+    assert val[:3] == pytest.approx((2.0, 3.0, 4.0))
+
+
+@pytest.mark.parametrize(
+    "list_body, expected",
+    [
+        ("// no cells on this processor\n", (0.0, 0.0, 0.0)),
+        ("(1 2 3)\n-\n(3 4 5)\n", (2.0, 3.0, 4.0)),
+    ],
+)
+def test_parse_vector_field_empty_or_stray_token_list(tmp_path, list_body, expected):
+    u_file = tmp_path / "U"
+    u_file.write_text(
+        f"internalField nonuniform List<vector> 0\n(\n{list_body})\n;\n"
+        "boundaryField\n{\n}\n"
+    )
+
+    parser = OpenFOAMFieldParser(tmp_path)
+    with patch("backend.plots.realtime_plots.RUST_ACCELERATOR", False), patch(
+        "backend.plots.realtime_plots.logger"
+    ) as mock_logger:
+        val = parser.parse_vector_field(str(u_file), check_mtime=False, store_cache=False)
+
+    mock_logger.error.assert_not_called()
+    assert val == pytest.approx(expected)
+
+
+@pytest.mark.parametrize(
+    "method, body, expected",
+    [
+        ("parse_scalar_field", "uniform 5", 5.0),
+        ("parse_vector_field", "uniform (1 2 3)", (1.0, 2.0, 3.0)),
+    ],
+)
+def test_uniform_internal_field_ignores_nonuniform_patch_value(tmp_path, method, body, expected):
+    f = tmp_path / "field"
+    f.write_text(
+        f"internalField {body};\nboundaryField\n{{\n    inlet {{ type fixedValue; "
+        "value nonuniform List<scalar> 2(100 200); }\n}\n"
+    )
+
+    parser = OpenFOAMFieldParser(tmp_path)
+    with patch("backend.plots.realtime_plots.RUST_ACCELERATOR", False):
+        val = getattr(parser, method)(str(f), check_mtime=False, store_cache=False)
+
+    if isinstance(expected, tuple):
+        assert val[:3] == pytest.approx(expected)
+    else:
+        assert val == pytest.approx(expected)
+
+
+def test_streaming_field_sums_across_chunks(tmp_path):
+    import mmap as mmap_mod
+    from backend.plots import realtime_plots
+
+    scalars = np.arange(1000, dtype=float)
+    vectors = np.arange(3000, dtype=float).reshape(-1, 3)
+    scalar_blob = b"\n".join(b"%r" % v for v in scalars.tolist())
+    vector_blob = b"\n".join(b"(%r %r %r)" % tuple(v) for v in vectors.tolist())
+    blob_file = tmp_path / "blob"
+    blob_file.write_bytes(scalar_blob + b"\n|" + vector_blob)
+
+    with open(blob_file, "rb") as f, mmap_mod.mmap(
+        f.fileno(), 0, access=mmap_mod.ACCESS_READ
+    ) as mm:
+        split = len(scalar_blob) + 1
+        with patch.object(realtime_plots, "STREAMING_CHUNK_BYTES", 64):
+            sums, count = realtime_plots._streaming_field_sums(mm, 0, split, 1)
+            vsums, vcount = realtime_plots._streaming_field_sums(mm, split + 1, len(mm), 3)
+
+    assert count == 1000
+    assert sums[0] == pytest.approx(scalars.sum())
+    assert vcount == 1000
+    assert vsums == pytest.approx(vectors.sum(axis=0))
+
+
+@pytest.mark.parametrize("size, advised", [(64, False), (4096, True)])
+def test_streaming_field_sums_advises_sequential_for_large_lists(size, advised):
+    from backend.plots import realtime_plots
+
+    class FakeMap(bytes):
+        def madvise(self, *args):
+            self.advice = args
+
+    mm = FakeMap(b"1\n" * (size // 2))
+    with patch.object(realtime_plots, "STREAMING_CHUNK_BYTES", 1024), patch.object(
+        realtime_plots, "_MADV_SEQUENTIAL", 2
+    ):
+        sums, count = realtime_plots._streaming_field_sums(mm, 0, len(mm), 1)
+
+    assert count == size // 2
+    assert getattr(mm, "advice", None) == ((2,) if advised else None)
+
+
+def test_get_latest_time_data_reuses_payload_for_unchanged_dir(tmp_path):
+    from backend.plots.realtime_plots import clear_cache
+
+    clear_cache()
+    (tmp_path / "1").mkdir()
+    (tmp_path / "1" / "p").write_text("class volScalarField;\ninternalField uniform 5;")
+
+    parser = OpenFOAMFieldParser(tmp_path)
+    first = parser.get_latest_time_data()
+    assert first == {"time": 1.0, "p": 5.0}
+
+    with patch.object(OpenFOAMFieldParser, "parse_scalar_field") as mock_parse:
+        second = parser.get_latest_time_data()
+    mock_parse.assert_not_called()
+    assert second == first
+
+    # Callers get their own dict, so mutating it cannot poison the cache
+    second["p"] = -1.0
+    assert parser.get_latest_time_data()["p"] == 5.0
+    clear_cache()
+
+
+def test_get_field_type_caches_non_field_classes_by_name(tmp_path):
+    from backend.plots.realtime_plots import clear_cache
+
+    clear_cache()
+    for t in ("1", "2"):
+        (tmp_path / t).mkdir()
+        (tmp_path / t / "alphaPhi0").write_text("FoamFile { class surfaceScalarField; }")
+        (tmp_path / t / "partial").write_text("")
+
+    parser = OpenFOAMFieldParser(tmp_path)
+    assert parser._get_field_type(tmp_path / "1" / "alphaPhi0") is None
+    assert parser._get_field_type(tmp_path / "1" / "partial") is None
+
+    with patch("backend.plots.realtime_plots._read_header_bytes") as mock_read:
+        assert parser._get_field_type(tmp_path / "2" / "alphaPhi0") is None
+    mock_read.assert_not_called()
+
+    # Files without a class line may still be mid-write, so they are re-checked
+    (tmp_path / "2" / "partial").write_text("FoamFile { class volScalarField; }")
+    assert parser._get_field_type(tmp_path / "2" / "partial") == "scalar"
+    clear_cache()
+
+
+def test_get_field_type_probes_small_header_then_extends(tmp_path):
+    from backend.plots import realtime_plots
+
+    realtime_plots.clear_cache()
+    (tmp_path / "1").mkdir()
+    stock = tmp_path / "1" / "stock"
+    stock.write_text("/*" + "-" * 600 + "*/\nFoamFile\n{\n    class volScalarField;\n}\n" + " " * 4096)
+    custom = tmp_path / "1" / "custom"
+    custom.write_text("/*" + "-" * 1500 + "*/\nFoamFile\n{\n    class volVectorField;\n}\n" + " " * 4096)
+
+    parser = OpenFOAMFieldParser(tmp_path)
+    with patch.object(
+        realtime_plots, "_read_header_bytes", wraps=realtime_plots._read_header_bytes
+    ) as mock_read:
+        assert parser._get_field_type(stock) == "scalar"
+        assert mock_read.call_count == 1
+        assert parser._get_field_type(custom) == "vector"
+        assert mock_read.call_count == 3
+    realtime_plots.clear_cache()
+
+
+def test_mmap_file_maps_contents_and_skips_empty(tmp_path):
+    from backend.plots.realtime_plots import _mmap_file
+
+    empty = tmp_path / "empty"
+    empty.write_bytes(b"")
+    assert _mmap_file(str(empty)) is None
+
+    field = tmp_path / "p"
+    field.write_bytes(b"internalField uniform 1;")
+    mm = _mmap_file(str(field))
+    with mm:
+        assert mm[:] == b"internalField uniform 1;"
+
+    with pytest.raises(FileNotFoundError):
+        _mmap_file(str(tmp_path / "missing"))
+
+
+def test_read_header_bytes_falls_back_without_noatime(tmp_path):
+    from backend.plots import realtime_plots
+
+    f = tmp_path / "p"
+    f.write_bytes(b"FoamFile { class volScalarField; }" + b" " * 4096)
+    assert realtime_plots._read_header_bytes(str(f), 2048) == (
+        b"FoamFile { class volScalarField; }" + b" " * 2014
+    )
+
+    real_open = os.open
+
+    def deny_noatime(path, flags, *args):
+        if flags & 0x40000:
+            raise PermissionError(1, "Operation not permitted")
+        return real_open(path, flags, *args)
+
+    with patch.object(realtime_plots, "_header_noatime_flag", 0x40000), patch(
+        "backend.plots.realtime_plots.os.open", side_effect=deny_noatime
+    ):
+        assert realtime_plots._read_header_bytes(str(f), 8) == b"FoamFile"
+        assert realtime_plots._header_noatime_flag == 0
+
+
+def test_read_header_bytes_keeps_noatime_on_unreadable_file(tmp_path):
+    from backend.plots import realtime_plots
+
+    def deny_access(path, flags, *args):
+        raise PermissionError(13, "Permission denied")
+
+    with patch.object(realtime_plots, "_header_noatime_flag", 0x40000), patch(
+        "backend.plots.realtime_plots.os.open", side_effect=deny_access
+    ):
+        with pytest.raises(PermissionError):
+            realtime_plots._read_header_bytes(str(tmp_path / "p"), 8)
+        assert realtime_plots._header_noatime_flag == 0x40000
+
+
+@pytest.mark.parametrize(
+    "body, expected",
+    [
+        (b"internalField   uniform 1.5e-3;", b" 1.5e-3"),
+        (b"internalField uniform (1 2 3);", b" (1 2 3)"),
+        (b"internalField uniform $inlet;", b" $inlet"),
+        (b"internalField nonuniform List<scalar> 2(1 2);", None),
+        (b"internalField uniform 1", None),
+    ],
+)
+def test_uniform_value_bytes(tmp_path, body, expected):
+    import mmap as mmap_mod
+    from backend.plots.realtime_plots import _uniform_value_bytes
+
+    f = tmp_path / "field"
+    f.write_bytes(b"FoamFile {}\n" + body + b"\n")
+    with open(f, "rb") as fh, mmap_mod.mmap(fh.fileno(), 0, access=mmap_mod.ACCESS_READ) as mm:
+        assert _uniform_value_bytes(mm, mm.find(b"internalField")) == expected
+
+
+def test_get_field_type_reads_only_class_directive(tmp_path):
+    from backend.plots.realtime_plots import clear_cache
+
+    clear_cache()
+    f = tmp_path / "myVec"
+    f.write_text(
+        "// derived from a volScalarField\n"
+        "FoamFile\n{\n    version 2.0;\n    class       volVectorField;\n    object myVec;\n}\n"
+    )
+    truncated = tmp_path / "truncated"
+    truncated.write_text("FoamFile\n{\n    class       volScal")
+
+    parser = OpenFOAMFieldParser(tmp_path)
+    assert parser._get_field_type(f) == "vector"
+    assert parser._get_field_type(truncated) is None
+    clear_cache()
+
+
+@pytest.mark.parametrize(
+    "banner",
+    [
+        "/* Generated by the classic cavity tutorial script */\n",
+        "// subclass of volVectorField; see notes\n",
+        "/* class volVectorField; (old layout) */\n",
+    ],
+)
+def test_scan_time_dir_ignores_class_mentions_in_comments(tmp_path, banner):
+    from backend.plots.realtime_plots import clear_cache
+
+    clear_cache()
+    (tmp_path / "1").mkdir()
+    (tmp_path / "1" / "myField").write_text(
+        banner + "FoamFile\n{\n    class       volScalarField;\n}\n"
+        "internalField uniform 1;\n"
+    )
+
+    parser = OpenFOAMFieldParser(tmp_path)
+    scalars, has_u, _, _ = parser._scan_time_dir(tmp_path / "1")
+    assert scalars == ["myField"]
+    assert has_u is False
+    clear_cache()
+
+
+@pytest.mark.parametrize("case_dir", ["/", "/tmp/case", "relative/case"])
+def test_case_prefix_matches_os_path_join(case_dir):
+    parser = OpenFOAMFieldParser(case_dir)
+    assert f"{parser.case_prefix}0.1" == os.path.join(parser.case_dir_str, "0.1")
+
+
+@pytest.mark.parametrize("split", [3, 20, 60, 95, 120])
+def test_residuals_incremental_split_anywhere(tmp_path, split):
+    from backend.plots.realtime_plots import clear_cache
+
+    log = (
+        b"Time = 1\n\nsmoothSolver:  Solving for Ux, Initial residual = 0.5, Final residual = 1e-06, No Iterations 2\n"
+        b"Time = 2\n\nsmoothSolver:  Solving for Ux, Initial residual = 0.25, Final residual = 1e-06, No Iterations 2\n"
+    )
+    log_file = tmp_path / "log.foamRun"
+    log_file.write_bytes(log[:split])
+    clear_cache()
+    parser = OpenFOAMFieldParser(tmp_path)
+    parser.get_residuals_from_log()
+
+    # A line cut mid-token must be parsed once the rest of it is appended
+    with open(log_file, "ab") as f:
+        f.write(log[split:])
+    os.utime(log_file, (0, 12345))
+    res = parser.get_residuals_from_log()
+    assert list(res["time"]) == [1.0, 2.0]
+    assert list(res["Ux"]) == [0.5, 0.25]
+
+
+def test_scan_residuals_chunk_contract(tmp_path):
+    import mmap
+    from backend.plots.realtime_plots import _scan_residuals_chunk
+
+    log = (
+        b"Time = 1\n"
+        b"GAMG:  Solving for p, Initial residual = 0.5, Final residual = 1e-06\n"
+        b"smoothSolver:  Solving for Ux, Initial residual = 0.25, Final residual = 1e-06\n"
+        b"Time = 2\n"
+        b"GAMG:  Solving for p, Initial residual = 0.125, Final residual = 1e-06\n"
+        b"Time = 3\nGAMG:  Solving for p, Initial resid"
+    )
+    path = tmp_path / "log"
+    path.write_bytes(log)
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        times, fields, new_offset = _scan_residuals_chunk(mm, 0)
+
+    assert times == [1.0, 2.0, 3.0]
+    assert fields == [("p", [0.5, 0.125]), ("Ux", [0.25])]
+    # The unterminated last line is left for the next scan
+    assert new_offset == log.rindex(b"\n") + 1
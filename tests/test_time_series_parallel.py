@@ -0,0 +1,307 @@
+import os
+import pytest
+from unittest.mock import patch
+
+from backend.plots.realtime_plots import OpenFOAMFieldParser, clear_cache
+
+
+def _write_case(case_dir, n_steps):
+    for i in range(n_steps):
+        t = case_dir / f"{i + 1}"
+        t.mkdir()
+        (t / "p").write_text(f"class volScalarField;\ninternalField uniform {i};")
+        (t / "k").write_text(f"class volScalarField;\ninternalField uniform {2 * i};")
+        (t / "U").write_text(f"class volVectorField;\ninternalField uniform ({i} 0 0);")
+
+
+@pytest.mark.parametrize("threshold", [0, 10_000])
+def test_stable_steps_parallel_matches_serial(tmp_path, threshold):
+    clear_cache()
+    _write_case(tmp_path, 40)
+
+    parser = OpenFOAMFieldParser(tmp_path)
+    with patch("backend.plots.realtime_plots.PARALLEL_PARSE_MIN_FILES", threshold):
+        data = parser.get_all_time_series_data(max_points=1000)
+
+    assert data["time"].tolist() == [float(i + 1) for i in range(40)]
+    assert data["p"].tolist() == [float(i) for i in range(40)]
+    assert data["k"].tolist() == [float(2 * i) for i in range(40)]
+    assert data["Ux"].tolist() == [float(i) for i in range(40)]
+    assert data["U_mag"].tolist() == pytest.approx([float(i) for i in range(40)])
+
+
+@pytest.mark.parametrize("threshold", [0, 10_000])
+def test_scan_time_dir_parallel_matches_serial(tmp_path, threshold):
+    clear_cache()
+    time_dir = tmp_path / "1"
+    time_dir.mkdir()
+    for i in range(20):
+        (time_dir / f"s{i}").write_text("class volScalarField;\ninternalField uniform 1;")
+    (time_dir / "U").write_text("class volVectorField;\ninternalField uniform (1 0 0);")
+    (time_dir / "notes").write_text("not a field")
+    (time_dir / ".hidden").write_text("class volScalarField;")
+
+    parser = OpenFOAMFieldParser(tmp_path)
+    with patch("backend.plots.realtime_plots.PARALLEL_SCAN_MIN_FILES", threshold):
+        scalar_fields, has_U, all_files, file_mtimes = parser._scan_time_dir(str(time_dir))
+
+    assert scalar_fields == sorted(f"s{i}" for i in range(20))
+    assert has_U is True
+    assert all_files == sorted([f"s{i}" for i in range(20)] + ["U", "notes"])
+    assert set(file_mtimes) == set(all_files)
+
+
+def test_time_series_history_window_is_bounded(tmp_path):
+    from backend.plots.realtime_plots import _TIME_SERIES_CACHE
+
+    clear_cache()
+    _write_case(tmp_path, 60)
+    parser = OpenFOAMFieldParser(tmp_path)
+
+    data = parser.get_all_time_series_data(max_points=10)
+    assert data["time"].tolist() == [float(i) for i in range(51, 61)]
+    assert data["p"].tolist() == [float(i) for i in range(50, 60)]
+
+    # Grow the case one step at a time; the cached window must stay bounded
+    for i in range(60, 90):
+        t = tmp_path / f"{i + 1}"
+        t.mkdir()
+        (t / "p").write_text(f"class volScalarField;\ninternalField uniform {i};")
+        (t / "k").write_text(f"class volScalarField;\ninternalField uniform {2 * i};")
+        (t / "U").write_text(f"class volVectorField;\ninternalField uniform ({i} 0 0);")
+        os.utime(tmp_path, None)
+        data = parser.get_all_time_series_data(max_points=10)
+        assert data["p"].tolist() == [float(j) for j in range(i - 9, i + 1)]
+        base, dirs, cached = _TIME_SERIES_CACHE[str(tmp_path)]
+        assert len(dirs) <= 18
+        assert all(len(v) == len(dirs) for v in cached.values())
+        assert dirs == [f"{j + 1}" for j in range(base, base + len(dirs))]
+
+    # A caller asking for a longer window gets the full range re-read
+    data = parser.get_all_time_series_data(max_points=50)
+    assert data["time"].tolist() == [float(i) for i in range(41, 91)]
+    assert data["U_mag"].tolist() == pytest.approx([float(i) for i in range(40, 90)])
+    clear_cache()
+
+
+def test_concurrent_polls_do_not_double_append(tmp_path):
+    import threading
+    from backend.plots.realtime_plots import _TIME_SERIES_CACHE
+
+    clear_cache()
+    _write_case(tmp_path, 30)
+    barrier = threading.Barrier(8)
+    results = []
+
+    def poll():
+        parser = OpenFOAMFieldParser(tmp_path)
+        barrier.wait()
+        results.append(parser.get_all_time_series_data(max_points=100))
+
+    threads = [threading.Thread(target=poll) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    expected = [float(i) for i in range(30)]
+    assert len(results) == 8
+    assert all(r["p"].tolist() == expected for r in results)
+    base, dirs, cached = _TIME_SERIES_CACHE[str(tmp_path)]
+    assert base == 0
+    assert all(len(v) == len(dirs) == 29 for v in cached.values())
+
+
+def test_time_series_json_matches_array_result(tmp_path):
+    import orjson
+    from backend.plots.realtime_plots import _TIME_SERIES_JSON_CACHE
+
+    clear_cache()
+    _write_case(tmp_path, 12)
+    parser = OpenFOAMFieldParser(tmp_path)
+
+    def expected(max_points):
+        data = parser.get_all_time_series_data(max_points=max_points)
+        return orjson.loads(orjson.dumps(data, option=orjson.OPT_SERIALIZE_NUMPY))
+
+    assert orjson.loads(parser.get_all_time_series_json(max_points=5)) == expected(5)
+    memo = _TIME_SERIES_JSON_CACHE[str(tmp_path)]
+
+    # An unchanged poll reuses the encoded stable history
+    assert orjson.loads(parser.get_all_time_series_json(max_points=5)) == expected(5)
+    assert _TIME_SERIES_JSON_CACHE[str(tmp_path)] is memo
+
+    # A new time step (with a new field) re-encodes the window
+    t = tmp_path / "13"
+    t.mkdir()
+    (t / "p").write_text("class volScalarField;\ninternalField uniform 12;")
+    (t / "T").write_text("class volScalarField;\ninternalField uniform 300;")
+    os.utime(tmp_path, None)
+    assert orjson.loads(parser.get_all_time_series_json(max_points=5)) == expected(5)
+    assert _TIME_SERIES_JSON_CACHE[str(tmp_path)] is not memo
+
+    clear_cache()
+    assert OpenFOAMFieldParser(tmp_path / "missing").get_all_time_series_json() == b"{}"
+
+
+def test_restart_with_rewritten_steps_refreshes_history(tmp_path):
+    import shutil
+
+    clear_cache()
+    _write_case(tmp_path, 10)
+    parser = OpenFOAMFieldParser(tmp_path)
+    parser.get_all_time_series_data(max_points=100)
+
+    # Restart from t=8: later steps are rewritten at different times, so the
+    # cached window keeps its length but its last entry no longer matches.
+    for name in ["9", "10"]:
+        shutil.rmtree(tmp_path / name)
+    for name, value in [("9.5", 95), ("10.5", 105)]:
+        t = tmp_path / name
+        t.mkdir()
+        (t / "p").write_text(f"class volScalarField;\ninternalField uniform {value};")
+    os.utime(tmp_path, None)
+
+    data = parser.get_all_time_series_data(max_points=100)
+    assert data["time"].tolist() == [float(i) for i in range(1, 9)] + [9.5, 10.5]
+    assert data["p"].tolist() == [float(i) for i in range(8)] + [95.0, 105.0]
+
+
+def test_steady_state_poll_skips_latest_step_parse(tmp_path):
+    clear_cache()
+    _write_case(tmp_path, 5)
+    parser = OpenFOAMFieldParser(tmp_path)
+    first = parser.get_all_time_series_data(max_points=100)
+
+    with patch.object(OpenFOAMFieldParser, "_scan_time_dir") as mock_scan:
+        again = parser.get_all_time_series_data(max_points=100)
+        assert mock_scan.call_count == 0
+    assert {k: v.tolist() for k, v in again.items()} == {
+        k: v.tolist() for k, v in first.items()
+    }
+
+    # A new file in the latest dir moves its mtime and forces a re-parse
+    (tmp_path / "5" / "T").write_text("class volScalarField;\ninternalField uniform 7;")
+    os.utime(tmp_path / "5", (0, 12345))
+    assert parser.get_all_time_series_data(max_points=100)["T"].tolist() == [7.0]
+
+
+def test_replaced_middle_step_invalidates_cached_window(tmp_path):
+    import shutil
+
+    clear_cache()
+    _write_case(tmp_path, 5)
+    parser = OpenFOAMFieldParser(tmp_path)
+    parser.get_all_time_series_data(max_points=100)
+
+    # Same first and last names, different step in between
+    shutil.rmtree(tmp_path / "2")
+    (tmp_path / "2.5").mkdir()
+    (tmp_path / "2.5" / "p").write_text("class volScalarField;\ninternalField uniform 99;")
+    (tmp_path / "2.5" / "k").write_text("class volScalarField;\ninternalField uniform 0;")
+    (tmp_path / "2.5" / "U").write_text("class volVectorField;\ninternalField uniform (0 0 0);")
+    os.utime(tmp_path, (0, 12345))
+
+    data = parser.get_all_time_series_data(max_points=100)
+    assert data["time"].tolist() == [1.0, 2.5, 3.0, 4.0, 5.0]
+    assert data["p"].tolist() == [0.0, 99.0, 2.0, 3.0, 4.0]
+    clear_cache()
+
+
+def test_field_added_mid_run_is_zero_backfilled(tmp_path):
+    clear_cache()
+    _write_case(tmp_path, 4)
+    parser = OpenFOAMFieldParser(tmp_path)
+    parser.get_all_time_series_data(max_points=100)
+
+    # T shows up from step 4 on; steps 1-3 were archived without it
+    (tmp_path / "4" / "T").write_text("class volScalarField;\ninternalField uniform 300;")
+    t = tmp_path / "5"
+    t.mkdir()
+    (t / "T").write_text("class volScalarField;\ninternalField uniform 301;")
+    (t / "p").write_text("class volScalarField;\ninternalField uniform 4;")
+    (t / "U").write_text("class volVectorField;\ninternalField uniform (4 0 0);")
+    os.utime(tmp_path, None)
+
+    data = parser.get_all_time_series_data(max_points=100)
+    assert data["time"].tolist() == [1.0, 2.0, 3.0, 4.0, 5.0]
+    assert data["T"].tolist() == [0.0, 0.0, 0.0, 300.0, 301.0]
+    assert data["p"].tolist() == [0.0, 1.0, 2.0, 3.0, 4.0]
+    assert data["Ux"].tolist() == [0.0, 1.0, 2.0, 3.0, 4.0]
+
+
+@pytest.mark.parametrize("n", [0, 1, 3, 10000])
+def test_zero_array_returns_fresh_zero_buffers(n):
+    from backend.plots.realtime_plots import _zero_array
+
+    zeros = _zero_array(n)
+    assert zeros.typecode == "d"
+    assert zeros.tolist() == [0.0] * n
+    zeros.append(1.0)
+    assert _zero_array(n).tolist() == [0.0] * n
+
+
+@pytest.mark.parametrize("n_items", [0, 1, 7, 8, 9, 500])
+def test_submit_chunks_preserves_order(n_items):
+    from backend.plots.realtime_plots import (
+        _get_io_executor,
+        _submit_chunks,
+        _gather_chunks,
+    )
+
+    items = [str(i) for i in range(n_items)]
+    futures = _submit_chunks(_get_io_executor(), int, items)
+    assert _gather_chunks(futures) == list(range(n_items))
+
+
+def test_scan_time_dir_only_queues_unknown_headers(tmp_path):
+    from backend.plots import realtime_plots
+
+    clear_cache()
+    time_dir = tmp_path / "1"
+    time_dir.mkdir()
+    for name in ("p", "k", "omega", "nut"):
+        (time_dir / name).write_text("class volScalarField;\ninternalField uniform 1;")
+    (time_dir / "U").write_text("class volVectorField;\ninternalField uniform (1 0 0);")
+    (time_dir / "custom").write_text("class volScalarField;\ninternalField uniform 1;")
+
+    parser = OpenFOAMFieldParser(tmp_path)
+    with patch.object(
+        realtime_plots, "_read_header_bytes", wraps=realtime_plots._read_header_bytes
+    ) as mock_read, patch.object(realtime_plots, "PARALLEL_SCAN_MIN_FILES", 0):
+        scalar_fields, has_U, _, _ = parser._scan_time_dir(str(time_dir))
+
+    assert scalar_fields == ["custom", "k", "nut", "omega", "p"]
+    assert has_U is True
+    assert [c.args[0] for c in mock_read.call_args_list] == [str(time_dir / "custom")]
+
+
+@pytest.mark.parametrize(
+    "cached, current, offset, expected",
+    [
+        ([1.0, 2.0, 3.0], [1.0, 2.0, 3.0, 4.0], 0, 3),
+        ([2.0, 3.0, 4.0], [1.0, 2.0, 3.5, 4.0], 1, 1),
+        ([2.0, 3.0], [1.0, 2.5, 3.0], 1, 0),
+    ],
+)
+def test_common_prefix_len(cached, current, offset, expected):
+    import array
+    from backend.plots.realtime_plots import _common_prefix_len
+
+    a = array.array("d", cached)
+    b = array.array("d", current)
+    length = min(len(a), len(b) - offset)
+    assert _common_prefix_len(a, b, offset, length) == expected
+    a.extend([9.0])  # no numpy view may outlive the call
+
+
+def test_history_u_mag_comes_from_parsed_vectors(tmp_path):
+    clear_cache()
+    for i in range(4):
+        t = tmp_path / f"{i + 1}"
+        t.mkdir()
+        (t / "U").write_text(f"class volVectorField;\ninternalField uniform ({3 * i} {4 * i} 0);")
+
+    data = OpenFOAMFieldParser(tmp_path).get_all_time_series_data(max_points=10)
+    assert data["U_mag"].tolist() == pytest.approx([0.0, 5.0, 10.0, 15.0])
+    assert len(data["U_mag"]) == len(data["Ux"]) == len(data["time"])
@@ -44,3 +44,46 @@ def test_resolve_variable_limit(tmp_path):
             # 3. Resolve without limit -> Should succeed (sanity check)
             val_no_limit = parser._resolve_variable(mm, b"varAfterLimit")
             assert val_no_limit == "20"
+
+
+def test_resolve_variable_chained_and_cyclic(tmp_path):
+    parser = OpenFOAMFieldParser(str(tmp_path))
+    content = b"""
+    inletValue 3.5;
+    alias $inletValue;
+    aliasOfAlias $alias;
+    loopA $loopB;
+    loopB $loopA;
+    calcVar #calc "1+2";
+    internalField uniform $aliasOfAlias;
+    """
+
+    # Chained references are followed to the final value
+    assert parser._resolve_variable(content, b"$aliasOfAlias") == "3.5"
+    assert parser._resolve_variable(content.decode(), "aliasOfAlias") == "3.5"
+
+    # Cyclic references terminate instead of recursing forever
+    assert parser._resolve_variable(content, b"loopA") is None
+
+    # #calc expressions are not evaluated
+    assert parser._resolve_variable(content, b"calcVar") is None
+
+
+def test_parse_dict_entries_matches_single_line_entries_at_any_depth():
+    from backend.plots.realtime_plots import _parse_dict_entries
+
+    content = b"""
+    // set the inlet value here
+    inletValue 3.5;
+    #inputMode merge
+    subDict { nestedValue 7; }
+    multiLine 1
+        2;
+    """
+    entries = _parse_dict_entries(content)
+
+    assert entries[b"inletValue"] == b"3.5"
+    assert entries[b"nestedValue"] == b"7"
+    assert b"set" not in entries and b"multiLine" not in entries
+    assert b"merge" not in entries
+